@@ -1,19 +1,47 @@
 import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.remote.webelement import WebElement
 from conftest import MiminetTester
-from utils.networks import MiminetTestNetwork, NodeType
-import time
+from utils.locators import Location, Locator
+from utils.networks import MiminetTestNetwork, NodeConfig, NodeType
+from typing import Tuple
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class TestDeviceNameChange:
     """
     Fixed version of device name change tests with proper wait conditions
     to handle MSTP implementation timing issues.
+
+    The class-scoped fixtures keep one network page open for all tests, so the
+    ``selenium`` fixture must live at least as long (it is session-scoped in
+    conftest.py).
     """
 
+    NODES_COUNT = 5
+
+    # Readiness checks flip quickly, so poll more often than the 0.5s default
+    POLL_FREQUENCY = 0.1
+
+    # Set an input value in one command instead of one per typed character.
+    # maxlength only limits typing, so it is applied here explicitly.
+    SET_VALUE_SCRIPT = (
+        "var field = arguments[0], value = arguments[1];"
+        "if (field.maxLength >= 0) { value = value.slice(0, field.maxLength); }"
+        "field.value = '';"
+        "field.value = value;"
+        "field.dispatchEvent(new Event('input', {bubbles: true}));"
+        "field.dispatchEvent(new Event('change', {bubbles: true}));"
+    )
+
     @pytest.fixture(scope="class")
     def network(self, selenium: MiminetTester):
         network = MiminetTestNetwork(selenium)
@@ -28,67 +56,118 @@ class TestDeviceNameChange:
 
         network.delete()
 
+    @pytest.fixture(scope="class")
+    def ready_network(self, selenium: MiminetTester, network: MiminetTestNetwork):
+        """
+        Network page that has already passed the readiness checks.
+        The page is loaded once per class instead of once per test.
+        """
+        selenium.get(network.url)
+        self._wait_for_page_ready(selenium)
+
+        yield network
+
+    @pytest.fixture(scope="class")
+    def mstp_js_loaded(
+        self, selenium: MiminetTester, ready_network: MiminetTestNetwork
+    ) -> bool:
+        """Whether MSTP-related components were found on the ready network page."""
+        return selenium.execute_script(
+            "return typeof window.showMstpConfig !== 'undefined' || "
+            "document.querySelector('#mstp') !== null || "
+            "document.querySelector('.mstp-config') !== null"
+        )
+
     def _wait_for_page_ready(self, selenium: MiminetTester, timeout: int = 20):
         """
         Wait for the page to be fully loaded and ready for interaction.
         This addresses the MSTP timing issues where DOM elements aren't ready.
         """
+        previous_script_timeout = selenium.timeouts.script
+        selenium.set_script_timeout(timeout)
+
         try:
-            # Wait for main network panel to be present and visible
-            WebDriverWait(selenium, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#main-panel"))
-            )
-            
-            # Wait for device panel to be loaded
-            WebDriverWait(selenium, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".device-panel"))
-            )
-            
-            # Wait for JavaScript to be fully loaded (check for global variables)
-            WebDriverWait(selenium, timeout).until(
-                lambda driver: driver.execute_script("return typeof nodes !== 'undefined'")
+            # Check that the device panel is visible and the JavaScript globals
+            # (including the MSTP-related ones) are loaded. The check is
+            # repeated inside the browser, so the whole wait is one command
+            # that returns as soon as the page is ready. The network scheme
+            # comes from the same template, so it doesn't need a separate check.
+            selenium.execute_async_script(
+                "var selector = arguments[0], interval = arguments[1],"
+                "  done = arguments[arguments.length - 1];"
+                "(function check() {"
+                "  var panel = document.querySelector(selector);"
+                "  if (panel && panel.getClientRects().length > 0 &&"
+                "      typeof nodes !== 'undefined' &&"
+                "      typeof ShowSwitchConfig !== 'undefined') {"
+                "    done(true);"
+                "  } else {"
+                "    setTimeout(check, interval);"
+                "  }"
+                "})();",
+                Location.Network.DEVICE_PANEL.selector,
+                self.POLL_FREQUENCY * 1000,
             )
-            
-            # Additional wait for MSTP-related JavaScript to load
-            WebDriverWait(selenium, timeout).until(
-                lambda driver: driver.execute_script(
-                    "return typeof ShowSwitchConfig !== 'undefined'"
-                )
-            )
-            
-            # Small additional wait to ensure all DOM manipulations are complete
-            time.sleep(2)
-            
+
         except TimeoutException as e:
             raise TimeoutException(
                 f"Page not ready after {timeout} seconds. "
                 f"This may be due to MSTP implementation loading time. "
                 f"Original error: {str(e)}"
             )
+        finally:
+            selenium.set_script_timeout(previous_script_timeout)
+
+    def _name_form_locators(self, config: NodeConfig) -> Tuple[Locator, Locator]:
+        """
+        Locators of the name field and submit button in the device config.
 
-    def _wait_for_config_panel_ready(self, selenium: MiminetTester, timeout: int = 15):
+        Returns:
+            Tuple[Locator, Locator]: The name field and the submit button locators.
+        """
+        locator = config.locator
+        assert (
+            locator.NAME_FIELD and locator.SUBMIT_BUTTON
+        ), f'Unable to change name for this element: "{locator}".'
+
+        return locator.NAME_FIELD, locator.SUBMIT_BUTTON
+
+    def _wait_for_config_panel_ready(
+        self, config: NodeConfig, selenium: MiminetTester, timeout: int = 15
+    ) -> Tuple[WebElement, WebElement]:
         """
         Wait for the configuration panel to be fully loaded and interactive.
+
+        Returns:
+            Tuple[WebElement, WebElement]: The name field and the submit button.
         """
+        name_locator, submit_locator = self._name_form_locators(config)
+        name_selector = name_locator.selector
+        submit_selector = submit_locator.selector
+
         try:
-            # Wait for config panel to appear
-            WebDriverWait(selenium, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".config-panel"))
-            )
-            
-            # Wait for name field to be present and interactable
-            WebDriverWait(selenium, timeout).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "input[name='name']"))
-            )
-            
-            # Wait for submit button to be present
-            WebDriverWait(selenium, timeout).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
+            # Check that the config panel is shown and that the name field and
+            # submit button are clickable (visible and enabled) in a single
+            # script per poll. The script returns both elements once ready.
+            name_field, submit_button = WebDriverWait(
+                selenium, timeout, poll_frequency=self.POLL_FREQUENCY
+            ).until(
+                lambda driver: driver.execute_script(
+                    "var shown = function (el) {"
+                    "  return !!el && el.getClientRects().length > 0;"
+                    "};"
+                    "var panel = document.querySelector(arguments[0]),"
+                    "  name = document.querySelector(arguments[1]),"
+                    "  submit = document.querySelector(arguments[2]);"
+                    "var ready = shown(panel) && shown(name) && !name.disabled && "
+                    "  shown(submit) && !submit.disabled;"
+                    "return ready ? [name, submit] : false;",
+                    Location.Network.CONFIG_PANEL.selector,
+                    name_selector,
+                    submit_selector,
+                )
             )
-            
-            # Additional wait for any MSTP-related modal elements to load
-            time.sleep(1)
-            
+
         except TimeoutException as e:
             raise TimeoutException(
                 f"Config panel not ready after {timeout} seconds. "
@@ -96,182 +175,156 @@ class TestDeviceNameChange:
                 f"Original error: {str(e)}"
             )
 
-    def _safe_change_name(self, config, new_name: str, selenium: MiminetTester):
+        return name_field, submit_button
+
+    def _safe_change_name(
+        self,
+        config: NodeConfig,
+        name_field: WebElement,
+        new_name: str,
+        selenium: MiminetTester,
+    ):
         """
         Safely change device name with proper wait conditions.
         """
+        name_locator, _ = self._name_form_locators(config)
+
         try:
-            # Wait for the name field to be ready
-            name_field = WebDriverWait(selenium, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "input[name='name']"))
-            )
-            
-            # Clear and set new name with retry logic
-            for attempt in range(3):
-                try:
-                    name_field.clear()
-                    name_field.send_keys(new_name)
-                    
-                    # Verify the value was set
-                    if name_field.get_attribute("value") == new_name:
-                        break
-                        
-                except Exception as e:
-                    if attempt == 2:  # Last attempt
-                        raise e
-                    time.sleep(1)  # Wait before retry
-            
-        except Exception as e:
-            # Fallback to original method if direct approach fails
-            print(f"Direct name change failed, using fallback: {e}")
-            config.change_name(new_name)
-
-    def _safe_submit_config(self, config, selenium: MiminetTester):
+            selenium.execute_script(self.SET_VALUE_SCRIPT, name_field, new_name)
+        except StaleElementReferenceException:
+            # The form was re-rendered, look the field up again
+            name_field = selenium.find_element(By.CSS_SELECTOR, name_locator.selector)
+            selenium.execute_script(self.SET_VALUE_SCRIPT, name_field, new_name)
+
+    def _safe_submit_config(
+        self, config: NodeConfig, submit_button: WebElement, selenium: MiminetTester
+    ):
         """
         Safely submit configuration with proper wait conditions.
         """
+        _, submit_locator = self._name_form_locators(config)
+
         try:
-            # Wait for submit button to be clickable
-            submit_button = WebDriverWait(selenium, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
-            )
-            
-            # Click submit with retry logic
-            for attempt in range(3):
-                try:
-                    submit_button.click()
-                    
-                    # Wait for the config panel to close or show success
-                    WebDriverWait(selenium, 5).until(
-                        lambda driver: not driver.find_elements(
-                            By.CSS_SELECTOR, ".config-panel"
-                        ) or driver.find_elements(
-                            By.CSS_SELECTOR, ".success-message"
-                        )
-                    )
-                    break
-                    
-                except Exception as e:
-                    if attempt == 2:  # Last attempt
-                        raise e
-                    time.sleep(1)  # Wait before retry
-            
-        except Exception as e:
-            # Fallback to original method if direct approach fails
-            print(f"Direct submit failed, using fallback: {e}")
-            config.submit()
+            submit_button.click()
+        except StaleElementReferenceException:
+            # The form was re-rendered, look the button up again
+            selenium.find_element(By.CSS_SELECTOR, submit_locator.selector).click()
+
+        # The config panel stays open after saving; the submit button
+        # is blanked while saving and gets its text back when done
+        selenium.wait_until_text(
+            By.CSS_SELECTOR,
+            submit_locator.selector,
+            submit_locator.text,
+            timeout=5,
+        )
 
+    @pytest.mark.parametrize("node_id", range(NODES_COUNT))
     def test_device_name_change(
         self,
         selenium: MiminetTester,
-        network: MiminetTestNetwork,
+        ready_network: MiminetTestNetwork,
+        node_id: int,
     ):
         """
         Test device name change with proper wait conditions for MSTP compatibility.
         """
-        selenium.get(network.url)
-        
-        # Wait for page to be fully ready (addresses MSTP loading time)
-        self._wait_for_page_ready(selenium)
+        node = ready_network.nodes[node_id]
+        logger.debug("Testing node %d: %s", node_id, node["data"].get("label"))
+        old_label = node["config"]["label"]
 
-        for node_id, node in enumerate(network.nodes):
-            print(f"Testing node {node_id}: {node.get('data', {}).get('label', 'Unknown')}")
-            
-            # Open config with additional wait time
-            config = network.open_node_config(node)
-            
-            # Wait for config panel to be ready
-            self._wait_for_config_panel_ready(selenium)
-
-            # Change device name with safe method
-            new_device_name = "new name!"
-            self._safe_change_name(config, new_device_name, selenium)
-
-            # Submit with safe method
-            self._safe_submit_config(config, selenium)
-            
-            # Wait for changes to be applied
-            time.sleep(2)
-
-            # Verify the change
-            updated_node = network.nodes[node_id]
-            actual_name = updated_node["config"]["label"]
-            
-            assert actual_name == new_device_name, (
-                f"Failed to change device name. "
-                f"Expected: '{new_device_name}', Got: '{actual_name}'"
-            )
-            
-            print(f"✅ Successfully changed node {node_id} name to '{new_device_name}'")
+        # Open config with additional wait time
+        config = ready_network.open_node_config(node)
+
+        # Wait for config panel to be ready
+        name_field, submit_button = self._wait_for_config_panel_ready(config, selenium)
+
+        # Change device name with safe method
+        new_device_name = "new name!"
+        self._safe_change_name(config, name_field, new_device_name, selenium)
 
+        # Submit with safe method
+        self._safe_submit_config(config, submit_button, selenium)
+
+        # Wait for changes to be applied
+        WebDriverWait(selenium, 10).until(
+            lambda _: ready_network.nodes[node_id]["config"]["label"] != old_label
+        )
+
+        # Verify the change
+        updated_node = ready_network.nodes[node_id]
+        actual_name = updated_node["config"]["label"]
+
+        assert actual_name == new_device_name, (
+            f"Failed to change device name. "
+            f"Expected: '{new_device_name}', Got: '{actual_name}'"
+        )
+
+        logger.debug("Changed node %d name to '%s'", node_id, new_device_name)
+
+    @pytest.mark.parametrize("node_id", range(NODES_COUNT))
     def test_device_name_change_to_long(
-        self, selenium: MiminetTester, network: MiminetTestNetwork
+        self, selenium: MiminetTester, ready_network: MiminetTestNetwork, node_id: int
     ):
         """
         Test device name change to long string with proper wait conditions for MSTP compatibility.
         """
-        # Wait for page to be fully ready (addresses MSTP loading time)
-        self._wait_for_page_ready(selenium)
-        
-        for node_id, node in enumerate(network.nodes):
-            print(f"Testing long name for node {node_id}: {node.get('data', {}).get('label', 'Unknown')}")
-            
-            # Open config with additional wait time
-            config = network.open_node_config(node)
-            
-            # Wait for config panel to be ready
-            self._wait_for_config_panel_ready(selenium)
-
-            # Change device name to long string
-            new_device_name = "a" * 100  # long name
-            self._safe_change_name(config, new_device_name, selenium)
-
-            # Submit with safe method
-            self._safe_submit_config(config, selenium)
-            
-            # Wait for changes to be applied
-            time.sleep(2)
-
-            # Verify the name was truncated
-            updated_node = network.nodes[node_id]
-            actual_name = updated_node["config"]["label"]
-            
-            assert actual_name != new_device_name, (
-                f"The device name isn't limited in size. "
-                f"Expected truncation but got full name: '{actual_name}'"
-            )
-            
-            assert len(actual_name) < len(new_device_name), (
-                f"Device name should be truncated. "
-                f"Original length: {len(new_device_name)}, "
-                f"Actual length: {len(actual_name)}"
-            )
-            
-            print(f"✅ Successfully verified node {node_id} name truncation: '{actual_name}'")
+        node = ready_network.nodes[node_id]
+        logger.debug(
+            "Testing long name for node %d: %s", node_id, node["data"].get("label")
+        )
+        old_label = node["config"]["label"]
 
-    def test_mstp_compatibility_check(self, selenium: MiminetTester, network: MiminetTestNetwork):
+        # Open config with additional wait time
+        config = ready_network.open_node_config(node)
+
+        # Wait for config panel to be ready
+        name_field, submit_button = self._wait_for_config_panel_ready(config, selenium)
+
+        # Change device name to long string
+        new_device_name = "a" * 100  # long name
+        self._safe_change_name(config, name_field, new_device_name, selenium)
+
+        # Submit with safe method
+        self._safe_submit_config(config, submit_button, selenium)
+
+        # Wait for changes to be applied
+        WebDriverWait(selenium, 10).until(
+            lambda _: ready_network.nodes[node_id]["config"]["label"] != old_label
+        )
+
+        # Verify the name was truncated
+        updated_node = ready_network.nodes[node_id]
+        actual_name = updated_node["config"]["label"]
+
+        assert actual_name != new_device_name, (
+            f"The device name isn't limited in size. "
+            f"Expected truncation but got full name: '{actual_name}'"
+        )
+
+        assert len(actual_name) < len(new_device_name), (
+            f"Device name should be truncated. "
+            f"Original length: {len(new_device_name)}, "
+            f"Actual length: {len(actual_name)}"
+        )
+
+        logger.debug("Verified node %d name truncation: '%s'", node_id, actual_name)
+
+    def test_mstp_compatibility_check(
+        self, ready_network: MiminetTestNetwork, mstp_js_loaded: bool
+    ):
         """
         Additional test to verify MSTP components don't interfere with basic functionality.
         """
-        selenium.get(network.url)
-        self._wait_for_page_ready(selenium)
-        
-        # Check that MSTP-related JavaScript is loaded
-        mstp_js_loaded = selenium.execute_script(
-            "return typeof window.showMstpConfig !== 'undefined' || "
-            "document.querySelector('#mstp') !== null || "
-            "document.querySelector('.mstp-config') !== null"
-        )
-        
-        print(f"MSTP JavaScript components detected: {mstp_js_loaded}")
-        
+        logger.debug("MSTP JavaScript components detected: %s", mstp_js_loaded)
+
         # Verify basic network functionality still works
-        nodes_count = len(network.nodes)
+        nodes_count = len(ready_network.nodes)
         assert nodes_count > 0, "Network should have nodes"
-        
+
         # Test that we can still access node data
-        for node in network.nodes:
+        for node in ready_network.nodes:
             assert "data" in node, "Node should have data property"
             assert "id" in node["data"], "Node data should have id"
-            
-        print(f"✅ MSTP compatibility verified - {nodes_count} nodes accessible")
\ No newline at end of file
+
+        logger.debug("MSTP compatibility verified - %d nodes accessible", nodes_count)
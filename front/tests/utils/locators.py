@@ -55,6 +55,8 @@ class Location:
 
         # Panel where you can place network devices and connect them
         MAIN_PANEL = Locator("#network_scheme")
+        # Panel with buttons for adding network devices
+        DEVICE_PANEL = Locator("#side_menu")
         # Network device (or edge) configuration panel
         CONFIG_PANEL = Locator("#config_content")
         # Modal dialog for user warnings
@@ -249,6 +249,11 @@ class NodeConfig:
         self.__node = node
         self.__open_config(node)
 
+    @property
+    def locator(self) -> Type[Location.Network.ConfigPanel.CommonDevice]:
+        """Locators of the configuration panel elements for the current device."""
+        return self.__config_locator
+
     @property
     def name(self):
         """Current name of the network device displayed in the configuration."""